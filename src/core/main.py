@@ -1,15 +1,89 @@
 import argparse
+import asyncio
+import os
 import warnings
 
 from utils import (
+    CONFIG,
+    MAX_WORKERS,
     init_aws_client,
+    warm_up_client,
     get_filenames,
     check_path_is_directory,
     upload_files,
+    upload_files_async,
     boilerplate_warning,
 )
 
 
+def _prepare_upload(
+    root_path: str,
+    bucket_name: str,
+    aws_region_name: str,
+    recursive: bool,
+    replace_if_exists: bool,
+    aws_profile_name: str,
+    key_prefix: str,
+    extensions: tuple,
+    max_workers: int,
+    max_concurrency: int,
+    skip_dirs: tuple,
+    skip_hidden_dirs: bool,
+) -> dict:
+    """
+    Shared setup for main and main_async - confirms the upload with the user, creates the
+    S3 client and gathers the files to upload.
+
+    Takes the same parameters as main.
+
+    Returns
+    -------
+    dict
+        Keyword arguments for upload_files / upload_files_async.
+    """
+    boilerplate_warning()
+
+    if max_workers is None:
+        max_workers = MAX_WORKERS
+
+    client = init_aws_client(
+        service_name="s3",
+        profile_name=aws_profile_name,
+        region_name=aws_region_name,
+        # Up to max_workers files at once, each sending up to max_concurrency parts.
+        max_pool_connections=max_workers * (max_concurrency or CONFIG.max_concurrency),
+    )
+    warm_up_client(s3_client=client, bucket_name=bucket_name)
+
+    root_path_is_directory = check_path_is_directory(root_path=root_path)
+
+    if root_path_is_directory:
+        files = get_filenames(
+            root_path=root_path,
+            recursive=recursive,
+            extensions=extensions,
+            skip_dirs=skip_dirs,
+            skip_hidden_dirs=skip_hidden_dirs,
+        )
+    else:
+        if recursive:
+            warnings.warn(
+                message="Warning! Recursive flag does not change application state when uploading a single file!",
+                category=RuntimeWarning,
+            )
+        files = [(root_path, os.path.basename(root_path), os.path.getsize(root_path))]
+
+    return dict(
+        client=client,
+        files=files,
+        replace_if_exists=replace_if_exists,
+        bucket_name=bucket_name,
+        key_prefix=key_prefix,
+        max_workers=max_workers,
+        max_concurrency=max_concurrency,
+    )
+
+
 def main(
     root_path: str,
     bucket_name: str,
@@ -19,6 +93,10 @@ def main(
     aws_profile_name: str = None,
     key_prefix: str = None,
     extensions: tuple = None,
+    max_workers: int = MAX_WORKERS,
+    max_concurrency: int = None,
+    skip_dirs: tuple = None,
+    skip_hidden_dirs: bool = False,
 ):
     """
     Main program entrypoint - runs the S3 video upload program.
@@ -56,48 +134,84 @@ def main(
     extensions: tuple (Optional)
         Valid file extensions to be uploaded.
 
+    max_workers: int (Optional)
+        Maximum number of files to upload at the same time. If not set, the max_workers
+        environment variable or its default of 16 is used.
+
+    max_concurrency: int (Optional)
+        Number of parts of each large file to upload at the same time. If not set, the
+        max_concurrency environment variable or its default of 16 is used.
+
+    skip_dirs: tuple (Optional)
+        Names of directories not to descend into when recursive is True.
+
+    skip_hidden_dirs: bool (Optional, default is False)
+        Whether to skip directories whose names start with "." when recursive is True.
+
     Returns
     -------
     None
     """
 
-    try:
-        files = []
+    upload_files(
+        **_prepare_upload(
+            root_path=root_path,
+            bucket_name=bucket_name,
+            aws_region_name=aws_region_name,
+            recursive=recursive,
+            replace_if_exists=replace_if_exists,
+            aws_profile_name=aws_profile_name,
+            key_prefix=key_prefix,
+            extensions=extensions,
+            max_workers=max_workers,
+            max_concurrency=max_concurrency,
+            skip_dirs=skip_dirs,
+            skip_hidden_dirs=skip_hidden_dirs,
+        )
+    )
 
-        boilerplate_warning()
 
-        client = init_aws_client(
-            service_name="s3", profile_name=aws_profile_name, region_name=aws_region_name
-        )
+async def main_async(
+    root_path: str,
+    bucket_name: str,
+    aws_region_name: str = "us-east-2",
+    recursive: bool = False,
+    replace_if_exists: bool = False,
+    aws_profile_name: str = None,
+    key_prefix: str = None,
+    extensions: tuple = None,
+    max_workers: int = MAX_WORKERS,
+    max_concurrency: int = None,
+    skip_dirs: tuple = None,
+    skip_hidden_dirs: bool = False,
+):
+    """
+    Asyncio entrypoint - runs the S3 video upload program on an event loop.
 
-        root_path_is_directory = check_path_is_directory(root_path=root_path)
+    Takes the same parameters as main. Files are taken from the scan as it runs and
+    uploaded on a dedicated pool of threads, with at most max_workers files in flight.
 
-        if root_path_is_directory:
-            files = list(
-                get_filenames(
-                    root_path=root_path, recursive=recursive, extensions=extensions
-                )
-            )
-        elif not root_path_is_directory:
-            if recursive:
-                warnings.warn(
-                    message="Warning! Recursive flag does not change application state when uploading a single file!",
-                    category=RuntimeWarning,
-                )
-            files = [root_path]
-
-        upload_files(
-            client=client,
-            files=files,
+    Returns
+    -------
+    None
+    """
+
+    await upload_files_async(
+        **_prepare_upload(
             root_path=root_path,
-            replace_if_exists=replace_if_exists,
             bucket_name=bucket_name,
+            aws_region_name=aws_region_name,
+            recursive=recursive,
+            replace_if_exists=replace_if_exists,
+            aws_profile_name=aws_profile_name,
             key_prefix=key_prefix,
-            root_path_is_directory=root_path_is_directory,
+            extensions=extensions,
+            max_workers=max_workers,
+            max_concurrency=max_concurrency,
+            skip_dirs=skip_dirs,
+            skip_hidden_dirs=skip_hidden_dirs,
         )
-
-    except Exception as e:
-        raise e
+    )
 
 
 if __name__ == "__main__":
@@ -134,22 +248,54 @@ if __name__ == "__main__":
         required=False,
         help="List of valid file extensions to upload (optional).",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        required=False,
+        default=None,
+        help="Maximum number of files to upload at the same time (optional, defaults to "
+        "the max_workers environment variable, or 16).",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        required=False,
+        help="Number of parts of each large file to upload at the same time (optional).",
+    )
     parser.add_argument(
         "--recursive",
         action="store_true",
         required=False,
         help="Whether to recursively search for files in subdirectories (optional).",
     )
+    parser.add_argument(
+        "--skip-dirs",
+        nargs="+",
+        required=False,
+        help="Names of directories not to descend into when --recursive is set (optional).",
+    )
+    parser.add_argument(
+        "--skip-hidden-dirs",
+        action="store_true",
+        required=False,
+        help="Whether to skip directories starting with '.' when --recursive is set (optional).",
+    )
     parser.add_argument(
         "--replace-if-exists",
         action="store_true",
         required=False,
         help="Whether the program will replace files that already exist in S3.",
     )
+    parser.add_argument(
+        "--use-asyncio",
+        action="store_true",
+        required=False,
+        help="Whether to schedule uploads on an asyncio event loop instead of a thread pool (optional).",
+    )
 
     args = parser.parse_args()
 
-    main(
+    kwargs = dict(
         root_path=args.root_path,
         bucket_name=args.bucket_name,
         replace_if_exists=args.replace_if_exists,
@@ -158,4 +304,13 @@ if __name__ == "__main__":
         aws_region_name=args.aws_region_name,
         key_prefix=args.key_prefix if args.key_prefix else None,
         extensions=tuple(args.extensions) if args.extensions else None,
+        max_workers=args.max_workers,
+        max_concurrency=args.max_concurrency,
+        skip_dirs=tuple(args.skip_dirs) if args.skip_dirs else None,
+        skip_hidden_dirs=args.skip_hidden_dirs,
     )
+
+    if args.use_asyncio:
+        asyncio.run(main_async(**kwargs))
+    else:
+        main(**kwargs)
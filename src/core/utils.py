@@ -1,47 +1,304 @@
+import asyncio
 import boto3
+import functools
 import os
 import sys
 import logging
 import threading
 import time
+import urllib3.connection
+from typing import Iterable, Iterator, Sized, Tuple
+from http.client import HTTPConnection
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-CONFIG = TransferConfig(
-    multipart_threshold=os.environ.get("multipart_threshold") or 1024 * 25,
-    max_concurrency=os.environ.get("max_concurrency") or 10,
-    multipart_chunksize=os.environ.get("multipart_chunksize") or 1024 * 25,
-    use_threads=os.environ.get("use_threads") or True,
-)
+
+def _env_int(name: str, default: int) -> int:
+    """
+    Reads an integer setting from the environment.
+
+    Parameters
+    ----------
+    name: str
+        Name of the environment variable.
+
+    default: int
+        Value to use when the variable is unset or empty.
+
+    Returns
+    -------
+    int
+        The variable's value converted to an int, or the default.
+    """
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """
+    Reads a boolean setting from the environment. "true", "1", "yes" and "y"
+    (case-insensitive) are True, anything else is False.
+
+    Parameters
+    ----------
+    name: str
+        Name of the environment variable.
+
+    default: bool
+        Value to use when the variable is unset or empty.
+
+    Returns
+    -------
+    bool
+        The variable's value converted to a bool, or the default.
+    """
+    value = os.environ.get(name)
+    return value.lower().strip() in ("true", "1", "yes", "y") if value else default
+
+
+def _transfer_client_options() -> dict:
+    """
+    Picks the transfer client boto3 should use for managed uploads, along with the
+    threading option that goes with it.
+
+    boto3 can hand managed transfers to the AWS Common Runtime (CRT) S3 client, which
+    runs parts on a C event loop instead of Python threads, so it isn't held back by the
+    GIL on fast networks. The CRT client is requested only when awscrt is installed
+    (pip install "boto3[crt]") and boto3 accepts preferred_transfer_client="crt".
+    Otherwise boto3's own default is kept: on 1.33+ that is "auto", which picks the CRT
+    client only on instance types it is tuned for. Older releases without the option,
+    like the one pinned in requirements.txt, are left alone.
+
+    The CRT client rejects s3transfer-only options such as use_threads, so use_threads
+    is only passed when it is turned off, and then the classic client is kept.
+
+    Set the transfer_client environment variable to "classic", "auto" or "crt" to
+    override the choice.
+
+    Returns
+    -------
+    dict
+        Extra keyword arguments for TransferConfig.
+    """
+    init = TransferConfig.__init__
+    supported = "preferred_transfer_client" in init.__code__.co_varnames
+
+    if not _env_bool("use_threads", True):
+        options = {"use_threads": False}
+        if supported:
+            options["preferred_transfer_client"] = "classic"
+        return options
+
+    if not supported:
+        return {}
+
+    transfer_client = os.environ.get("transfer_client")
+    if transfer_client:
+        return {"preferred_transfer_client": transfer_client}
+
+    # Only importable on the boto3/botocore releases that have the option above.
+    from boto3.s3 import constants
+    from botocore.compat import HAS_CRT
+
+    # boto3 releases before "crt" was accepted treat it as "classic", so it's only
+    # requested where boto3 defines it.
+    crt_transfer_client = getattr(constants, "CRT_TRANSFER_CLIENT", None)
+    if HAS_CRT and crt_transfer_client:
+        return {"preferred_transfer_client": crt_transfer_client}
+
+    return {}
+
+
+TRANSFER_CLIENT_OPTIONS = _transfer_client_options()
+
+
+def _build_transfer_config() -> TransferConfig:
+    """
+    Builds the TransferConfig used for uploads, reading overrides from the environment.
+
+    Returns
+    -------
+    TransferConfig
+        Transfer configuration for boto3's managed uploads.
+    """
+    return TransferConfig(
+        multipart_threshold=_env_int("multipart_threshold", 16 * 1024 * 1024),
+        # s3transfer submits each part as its own task on a pool of max_concurrency
+        # threads, so a new part starts as soon as any part finishes rather than waiting
+        # on a whole batch.
+        max_concurrency=_env_int("max_concurrency", 16),
+        multipart_chunksize=_env_int("multipart_chunksize", 16 * 1024 * 1024),
+        **TRANSFER_CLIENT_OPTIONS,
+    )
+
+
+# Every part is its own signed HTTP request, so part size dominates multipart throughput.
+# Parts below S3's 5 MiB minimum are mostly request overhead; throughput keeps climbing
+# up to roughly 64 MiB parts at the cost of more memory per in-flight part
+# (max_concurrency * multipart_chunksize). 16 MiB is a good default for mixed file sizes -
+# raise multipart_chunksize towards 64 MiB when uploading mostly multi-GB files.
+#
+# Rough starting points when tuning through the environment:
+#
+#   workload                      multipart_chunksize   max_concurrency
+#   many small files              8 MiB                 4 - 8
+#   mixed sizes (default)         16 MiB                16
+#   multi-GB files, fast network  32 - 64 MiB           16 - 32
+#
+# Raise max_concurrency until throughput stops improving; past that point extra threads
+# only add memory use and retries.
+CONFIG = _build_transfer_config()
+
+# Number of files uploaded at the same time. Per-file overhead (request signing, TLS,
+# TCP slow start) dominates for small files, so running several at once adds up their
+# throughput. Increase it until throughput stops improving - past that point extra
+# workers only compete for bandwidth and the connection pool. This is also the CLI's
+# default, which --max-workers overrides.
+MAX_WORKERS = _env_int("max_workers", 16)
+
+# Number of directories scanned at the same time by get_filenames_recursive. Listing a
+# directory is one metadata round-trip, which is what dominates on network filesystems
+# (NFS, Lustre, s3fs), so overlapping them speeds up large trees. Local disks gain less.
+SCAN_WORKERS = _env_int("scan_workers", 16)
+
+# Fewest files for which one listing of the key prefix is used to skip existing objects
+# instead of a HEAD request per file. Lazy iterators of unknown length count as many.
+LIST_KEYS_MIN_FILES = _env_int("list_keys_min_files", 1000)
+
+# Most keys the prefix may hold for it to be listed. Bigger prefixes fall back to a HEAD
+# request per file, so listing costs at most list_keys_max / 1000 LIST calls.
+LIST_KEYS_MAX = _env_int("list_keys_max", 10000)
+
+# Most parts a single multipart upload may have. S3 allows 10,000; some S3-compatible
+# providers allow fewer (Scaleway: 1,000).
+MAX_PARTS = _env_int("max_parts", 10000)
+
+SCANDIR_SUPPORTS_FD = os.scandir in os.supports_fd
+
+
+def _set_http_blocksize(blocksize: int) -> None:
+    """
+    Changes the default send/receive block size of http.client.HTTPConnection, and of
+    urllib3's connection classes where they declare one of their own.
+
+    http.client sends request bodies in blocksize pieces (8 KiB by default), so each
+    part upload is thousands of small send() calls made while holding the GIL. With
+    urllib3 1.x, botocore's connections never pass a block size, so the http.client
+    default applies. urllib3 2.x passes its own default of 16 KiB explicitly, so that
+    default is raised as well. Either way every part goes out in far fewer, larger
+    writes.
+
+    This changes the default for every http.client and urllib3 consumer in the process,
+    not just boto3. Set the S3_UPLOAD_HTTP_BUFSIZE environment variable to the block
+    size in bytes (default 1 MiB), or to 0 to leave them untouched.
+
+    Parameters
+    ----------
+    blocksize: int
+        New default block size in bytes.
+
+    Returns
+    -------
+    None
+    """
+    connection_classes = (
+        HTTPConnection,
+        urllib3.connection.HTTPConnection,
+        urllib3.connection.HTTPSConnection,
+    )
+
+    for connection_class in connection_classes:
+        init = connection_class.__init__
+        names = init.__code__.co_varnames[: init.__code__.co_argcount]
+
+        # urllib3 2.x takes blocksize as a keyword-only parameter.
+        if init.__kwdefaults__ and "blocksize" in init.__kwdefaults__:
+            init.__kwdefaults__ = {**init.__kwdefaults__, "blocksize": blocksize}
+        elif init.__defaults__ and "blocksize" in names[-len(init.__defaults__) :]:
+            defaults = list(init.__defaults__)
+            # __defaults__ lines up with the trailing positional parameters.
+            defaults[names[-len(defaults) :].index("blocksize")] = blocksize
+            init.__defaults__ = tuple(defaults)
+
+
+HTTP_BLOCKSIZE = _env_int("S3_UPLOAD_HTTP_BUFSIZE", 1024 * 1024)
+
+if HTTP_BLOCKSIZE:
+    _set_http_blocksize(HTTP_BLOCKSIZE)
 
 logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger()
 
 
 class ProgressPercentage(object):
-    def __init__(self, filename):
+    # Minimum number of seconds between progress lines for a single file.
+    PRINT_INTERVAL = 0.25
+    # Minimum fraction of the file uploaded between progress lines.
+    PRINT_STEP = 0.001
+
+    def __init__(self, filename, size=None):
+        # Callers that already know the size (e.g. from a directory scan) pass it in
+        # to save a stat call per file.
         self._filename = filename
-        self._size = float(os.path.getsize(filename))
+        self._size = float(os.path.getsize(filename) if size is None else size)
+        self._step = self._size * self.PRINT_STEP
         self._seen_so_far = 0
+        self._last_reported = 0
+        self._last_print = 0.0
         self._lock = threading.Lock()
+        # Progress goes straight to the stderr file descriptor. os.write is a single
+        # unbuffered syscall, so there's no TextIOWrapper lock or separate flush.
+        try:
+            self._fd = sys.stderr.fileno()
+        except (AttributeError, OSError):
+            # sys.stderr has been replaced by an object without a real descriptor.
+            self._fd = None
 
     def __call__(self, bytes_amount):
         # To simplify we'll assume this is hooked up to a single filename.
+        # The lock only guards the counters - writing to stderr happens outside of it,
+        # and is throttled so transfer threads aren't blocked on every chunk. Most
+        # callbacks return after a single comparison, without reading the clock.
         with self._lock:
             self._seen_so_far += bytes_amount
-            percentage = (self._seen_so_far / self._size) * 100
-            sys.stdout.write(
-                "\r%s  %s / %s  (%.2f%%)"
-                % (self._filename, self._seen_so_far, self._size, percentage)
-            )
-            sys.stdout.flush()
+            seen_so_far = self._seen_so_far
+            if seen_so_far < self._size:
+                if seen_so_far - self._last_reported < self._step:
+                    return
+                now = time.monotonic()
+                if now - self._last_print < self.PRINT_INTERVAL:
+                    return
+            else:
+                now = time.monotonic()
+            self._last_reported = seen_so_far
+            self._last_print = now
+
+        percentage = (seen_so_far / self._size) * 100 if self._size else 100.0
+        message = "\r%s  %s / %s  (%.2f%%)" % (
+            self._filename,
+            seen_so_far,
+            self._size,
+            percentage,
+        )
+        if self._fd is None:
+            sys.stderr.write(message)
+        else:
+            os.write(self._fd, message.encode())
 
 
+@functools.lru_cache(maxsize=None)
 def init_aws_client(
-    service_name: str, profile_name: str = None, region_name: str = "us-east-1"
+    service_name: str,
+    profile_name: str = None,
+    region_name: str = "us-east-1",
+    max_pool_connections: int = MAX_WORKERS * CONFIG.max_concurrency,
 ) -> boto3.client:
     """
-    Creates a client for the AWS service in the region specified.
+    Creates a client for the AWS service in the region specified. Clients are cached,
+    so repeated calls with the same arguments share one client and its pool of
+    keep-alive connections.
 
     Parameters
     ----------
@@ -54,6 +311,12 @@ def init_aws_client(
     region_name: str (Optional)
         Region to access the service in. Defaults to 'us-east-1'.
 
+    max_pool_connections: int (Optional)
+        Size of the client's HTTP connection pool. The client is shared across all upload
+        threads, so it needs a connection for every request in flight: files uploaded at
+        once times parts per file. Defaults to MAX_WORKERS * CONFIG.max_concurrency.
+        Connections are only opened as they are needed.
+
     Raises
     -------
     e: boto3.ClientError
@@ -62,21 +325,49 @@ def init_aws_client(
     -------
     boto3.client: Client of the resource you would like to access.
     """
-    try:
+    # Adaptive retries back off client-side when S3 throttles requests to a prefix.
+    config = Config(
+        max_pool_connections=max_pool_connections,
+        retries={"max_attempts": 10, "mode": "adaptive"},
+    )
 
-        if profile_name:
-            session = boto3.Session(profile_name=profile_name)
-            client = session.client(service_name=service_name, region_name=region_name)
-        else:
-            client = boto3.client(service_name, region_name=region_name)
+    if profile_name:
+        session = boto3.Session(profile_name=profile_name)
+        client = session.client(
+            service_name=service_name, region_name=region_name, config=config
+        )
+    else:
+        client = boto3.client(service_name, region_name=region_name, config=config)
 
-        if client:
-            return client
-        else:
-            raise ClientError
+    if client:
+        return client
+    else:
+        raise ClientError
+
+
+def warm_up_client(s3_client: boto3.client, bucket_name: str) -> None:
+    """
+    Sends one HEAD bucket request so DNS resolution, the TLS handshake and request signing
+    happen before the first upload, leaving a keep-alive connection in the client's pool.
+
+    Parameters
+    ----------
+    s3_client: boto3.client
+        Boto3 S3 client.
+
+    bucket_name: str
+        Name of the S3 bucket that will be uploaded to.
 
+    Returns
+    -------
+    None
+    """
+    try:
+        s3_client.head_bucket(Bucket=bucket_name)
     except ClientError as e:
-        raise e
+        # Credentials that may only PutObject can be refused here - the connection is
+        # still warm, so let the uploads themselves report any real problem.
+        logger.warning(f"HEAD bucket failed: {e.response['Error']['Code']}")
 
 
 def check_object_exists(
@@ -102,23 +393,127 @@ def check_object_exists(
         Whether or not the object exists in the S3 location specified.
     """
     try:
-        response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
+        s3_client.head_object(Bucket=bucket_name, Key=object_key)
         return True
-    except s3_client.exceptions.NoSuchKey:
-        return False
     except ClientError as e:
-        if e.response["Error"]["Code"] == "InvalidObjectState":
+        # HEAD responses have no body, so a missing key surfaces as a bare 404.
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            return False
+        elif e.response["Error"]["Code"] == "InvalidObjectState":
             logger.warning("Object exists but is in invalid state")
             return True
         else:
             return False
 
 
+def list_object_keys(
+    s3_client: boto3.client, bucket_name: str, prefix: str, max_keys: int = None
+) -> set:
+    """
+    Lists every object key under a prefix in an S3 bucket.
+
+    Parameters
+    ----------
+    s3_client: boto3.client
+        Boto3 S3 client.
+
+    bucket_name: str
+        Name of the S3 bucket to list objects in.
+
+    prefix: str
+        Key prefix to list objects under.
+
+    max_keys: int (Optional)
+        Stop listing after this many keys. Lists every key if not set.
+
+    Returns
+    -------
+    keys: set
+        Keys of all objects under the prefix, or the first max_keys of them.
+    """
+    keys = set()
+    paginator = s3_client.get_paginator("list_objects_v2")
+    pagination_config = {"MaxItems": max_keys} if max_keys else {}
+
+    for page in paginator.paginate(
+        Bucket=bucket_name, Prefix=prefix, PaginationConfig=pagination_config
+    ):
+        for obj in page.get("Contents", []):
+            keys.add(obj["Key"])
+
+    return keys
+
+
+def _list_existing_keys(
+    s3_client: boto3.client, bucket_name: str, prefix: str, files: Iterable
+) -> set:
+    """
+    Lists the keys already under prefix when that is cheaper than checking each file.
+
+    Parameters
+    ----------
+    s3_client: boto3.client
+        Boto3 S3 client.
+
+    bucket_name: str
+        Name of the S3 bucket to list objects in.
+
+    prefix: str
+        Key prefix every file will be uploaded under.
+
+    files: Iterable
+        Files that will be uploaded.
+
+    Returns
+    -------
+    keys: set
+        Keys of all objects under the prefix, or None if each file should be checked
+        with a HEAD request instead - when there are only a few files, the prefix holds
+        more than LIST_KEYS_MAX keys or it can't be listed.
+    """
+    # A listing returns 1000 keys per request however many files are uploaded, so a
+    # handful of files is cheaper to check one HEAD at a time.
+    if isinstance(files, Sized) and len(files) < LIST_KEYS_MIN_FILES:
+        return None
+
+    try:
+        # One key past the cap is enough to tell the prefix is too big to list.
+        keys = list_object_keys(
+            s3_client=s3_client,
+            bucket_name=bucket_name,
+            prefix=prefix,
+            max_keys=LIST_KEYS_MAX + 1,
+        )
+    except ClientError as e:
+        # Listing needs s3:ListBucket, which upload-only credentials may not have.
+        if e.response["Error"]["Code"] in ("403", "AccessDenied"):
+            logger.warning(
+                "Could not list existing objects, checking each file instead"
+            )
+            return None
+        raise
+
+    # A large prefix would cost many LIST calls and hold every key in memory before
+    # the first upload, so it's cheaper to check each file instead.
+    if len(keys) > LIST_KEYS_MAX:
+        return None
+
+    return keys
+
+
 def upload_file_to_s3(
-    s3_client: boto3.client, path_to_file: str, bucket_name: str, object_key: str
+    s3_client: boto3.client,
+    path_to_file: str,
+    bucket_name: str,
+    object_key: str,
+    file_size: int = None,
+    max_concurrency: int = None,
+    chunk_size: int = None,
+    max_parts: int = MAX_PARTS,
 ) -> None:
     """
-    Uploads a local file to AWS S3.
+    Uploads a local file to AWS S3. Files smaller than the multipart threshold are sent
+    with a single PutObject, larger files with a managed multipart upload.
 
     Parameters
     ----------
@@ -134,62 +529,255 @@ def upload_file_to_s3(
     object_key: str
         Name of the file once it lands in the S3 bucket.
 
+    file_size: int (Optional)
+        Size of the file in bytes, if already known. Otherwise the file is stat'ed.
+
+    max_concurrency: int (Optional)
+        Number of parts of a multipart upload to send at the same time. Defaults to
+        CONFIG.max_concurrency. 16-32 is usually enough to saturate a 10-100 Gbps link;
+        past roughly 20 threads the gains taper off and retries become more common.
+
+    chunk_size: int (Optional)
+        Minimum size of each multipart upload part in bytes. Defaults to
+        CONFIG.multipart_chunksize. Larger files get larger parts so they fit in max_parts.
+
+    max_parts: int (Optional)
+        Most parts the multipart upload may be split into. Defaults to MAX_PARTS.
+
     Returns
     -------
     None
     """
-    try:
+    if file_size is None:
+        file_size = os.path.getsize(path_to_file)
 
+    progress = ProgressPercentage(path_to_file, size=file_size)
+
+    # Files below the multipart threshold go up in one PutObject either way - sending it
+    # directly skips setting up a transfer manager and its thread pools for every file.
+    if file_size < CONFIG.multipart_threshold:
         with open(path_to_file, "rb") as f:
-            s3_client.upload_fileobj(
-                Fileobj=f,
-                Bucket=bucket_name,
-                Key=object_key,
-                Callback=ProgressPercentage(path_to_file),
-                Config=CONFIG,
-            )
+            s3_client.put_object(Bucket=bucket_name, Key=object_key, Body=f)
+        progress(file_size)
+        return
+
+    # Size parts so the file fits in 95% of max_parts. Multi-GB files then use fewer,
+    # larger parts instead of many round-trips, and stay clear of the provider's limit.
+    part_limit = max(1, max_parts * 95 // 100)
+    chunk_size = max(
+        chunk_size or CONFIG.multipart_chunksize, -(-file_size // part_limit)
+    )
 
-    except Exception as e:
-        raise e
+    config = CONFIG
+    if max_concurrency or chunk_size != CONFIG.multipart_chunksize:
+        config = TransferConfig(
+            multipart_threshold=CONFIG.multipart_threshold,
+            max_concurrency=max_concurrency or CONFIG.max_concurrency,
+            multipart_chunksize=chunk_size,
+            **TRANSFER_CLIENT_OPTIONS,
+        )
+
+    # upload_file lets each transfer thread open and seek into the file on its own,
+    # so parts are read in parallel instead of through one shared file object.
+    s3_client.upload_file(
+        Filename=path_to_file,
+        Bucket=bucket_name,
+        Key=object_key,
+        Callback=progress,
+        Config=config,
+    )
 
 
-def clean_file_list(root_path: str, files: list, extensions: tuple = None) -> list:
+def normalize_extensions(extensions: Iterable[str] = None) -> tuple:
     """
-    Removes files from a file list if they don't end with the given extensions.
-    Any files that remain are joined to the root_path to provide a complete path
-    to the file.
+    Normalizes file extensions so they can be compared against lowercased filenames.
 
     Parameters
     ----------
-    root_path: str
-        Absolute root file path that contains files.
+    extensions: Iterable[str] (Optional)
+        File extensions, with or without a leading "." and in any case, e.g. ("MP4", ".mov").
+
+    Returns
+    -------
+    tuple
+        Lowercased extensions with a leading ".", e.g. (".mp4", ".mov"),
+        or None if no extensions were given.
+    """
+    if not extensions:
+        return None
+
+    return tuple(
+        ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions
+    )
 
-    files: list
-        List of file names.
 
+def _suffix_lookup(extensions: tuple = None) -> Tuple[frozenset, int]:
+    """
+    Prepares normalized extensions for the single-lookup match in _scan_directory.
+
+    When every extension has the same length (e.g. ".mp4", ".mov", ".mkv"), a match is
+    one slice and set lookup per file, and only the suffix is lowercased rather than the
+    whole name. Mixed lengths fall back to str.endswith.
+
+    Parameters
+    ----------
     extensions: tuple (Optional)
-        Valid file extensions to be returned.
+        Normalized file extensions (see normalize_extensions).
 
     Returns
     -------
-    files_to_return: list
-        List of absolute path file names of the desired extension.
+    suffixes: frozenset
+        The extensions as a set, or None if no extensions were given.
+
+    suffix_length: int
+        Length shared by every extension, or None if they differ in length.
     """
-    try:
-        files_to_return = []
+    if not extensions:
+        return None, None
 
-        if extensions:
-            files = [file for file in files if file.endswith(extensions)]
-        for file in files:
-            files_to_return.append(os.path.join(root_path, file).replace("\\", "/"))
+    suffixes = frozenset(extensions)
+    suffix_lengths = {len(suffix) for suffix in suffixes}
 
-        return files_to_return
+    return suffixes, suffix_lengths.pop() if len(suffix_lengths) == 1 else None
 
-    except Exception as e:
-        raise e
 
+def _normalize_directory(directory: str) -> str:
+    """
+    Normalizes a directory path to use "/" as the separator and end in a single "/".
+
+    Parameters
+    ----------
+    directory: str
+        Path to a directory.
 
-def get_filenames_flat(root_path: str, extensions: tuple = None) -> list:
+    Returns
+    -------
+    str
+        The normalized directory path, e.g. "C:/Users/me/Videos/".
+    """
+    return directory.replace("\\", "/").rstrip("/") + "/"
+
+
+def _scan_directory(
+    directory: str,
+    relative_directory: str,
+    extensions: tuple = None,
+    suffixes: frozenset = None,
+    suffix_length: int = None,
+    skip_dirs: frozenset = frozenset(),
+    skip_hidden_dirs: bool = False,
+) -> Tuple[list, list]:
+    """
+    Scans a single directory with os.scandir, using the file type information cached on
+    each DirEntry instead of a stat call per entry. Symlinks to directories are not
+    followed, matching os.walk's default.
+
+    Parameters
+    ----------
+    directory: str
+        Path of the directory to scan, using "/" as the separator and ending in "/".
+
+    relative_directory: str
+        Path of the directory relative to the upload root, either "" or ending in "/".
+        Only the root ("") is opened through a symlink.
+
+    extensions: tuple (Optional)
+        Normalized file extensions (see normalize_extensions) to be returned.
+
+    suffixes: frozenset (Optional)
+        The extensions as a set, from _suffix_lookup.
+
+    suffix_length: int (Optional)
+        Length shared by every extension, from _suffix_lookup. When set, files are
+        matched by a set lookup on their last suffix_length characters.
+
+    skip_dirs: frozenset (Optional)
+        Names of subdirectories to leave out of the returned subdirectories.
+
+    skip_hidden_dirs: bool (Optional, default = False)
+        Whether to leave out subdirectories whose names start with ".".
+
+    Returns
+    -------
+    files: list
+        (absolute file path, path relative to the upload root, size in bytes) for each
+        matching file in the directory.
+
+    subdirectories: list
+        (path ending in "/", path relative to the upload root ending in "/") for each
+        subdirectory that is not skipped.
+    """
+    files = []
+    subdirectories = []
+
+    # Where supported (POSIX), scan through a directory file descriptor like os.fwalk:
+    # the stat calls for file sizes then resolve each name relative to the open
+    # directory instead of walking the full path from the root every time. If the entry
+    # was swapped since it was listed, O_DIRECTORY makes the open fail instead of
+    # blocking on a FIFO, and O_NOFOLLOW instead of following a symlink to a directory.
+    # Unreadable directories and entries that vanish mid-scan are logged and skipped,
+    # like os.walk does, rather than aborting the rest of the walk.
+    try:
+        if SCANDIR_SUPPORTS_FD:
+            path, flags = directory, os.O_RDONLY | os.O_DIRECTORY
+            # The root may be a symlink passed in by the caller, which os.walk follows
+            # too. O_NOFOLLOW only applies to the last component, which a trailing "/"
+            # would resolve anyway.
+            if relative_directory:
+                path, flags = directory[:-1], flags | os.O_NOFOLLOW
+            target = os.open(path, flags)
+        else:
+            target = directory
+    except OSError as e:
+        logger.warning(f"Skipping directory {directory}: {e}")
+        return files, subdirectories
+
+    try:
+        with os.scandir(target) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Pruned directories are never scanned, which saves a whole
+                        # listing per directory on large trees rather than filtering
+                        # their files afterwards.
+                        if entry.name in skip_dirs or (
+                            skip_hidden_dirs and entry.name.startswith(".")
+                        ):
+                            continue
+                        subdirectories.append(
+                            (
+                                f"{directory}{entry.name}/",
+                                f"{relative_directory}{entry.name}/",
+                            )
+                        )
+                    elif entry.is_file():
+                        if suffix_length:
+                            if entry.name[-suffix_length:].lower() not in suffixes:
+                                continue
+                        elif extensions and not entry.name.lower().endswith(extensions):
+                            continue
+
+                        files.append(
+                            (
+                                directory + entry.name,
+                                relative_directory + entry.name,
+                                entry.stat().st_size,
+                            )
+                        )
+                except OSError as e:
+                    logger.warning(f"Skipping {directory}{entry.name}: {e}")
+    except OSError as e:
+        logger.warning(f"Skipping directory {directory}: {e}")
+    finally:
+        if SCANDIR_SUPPORTS_FD:
+            os.close(target)
+
+    return files, subdirectories
+
+
+def get_filenames_flat(
+    root_path: str, extensions: tuple = None
+) -> Iterator[Tuple[str, str, int]]:
     """
     Gathers up all filenames in a directory - does not return filenames
     contained in subdirectories.
@@ -200,31 +788,39 @@ def get_filenames_flat(root_path: str, extensions: tuple = None) -> list:
         Absolute root file path that contains files you wish to retrieve.
 
     extensions: tuple (Optional)
-        Valid file extensions to be returned.
+        Valid file extensions to be returned. Matching is case-insensitive.
 
-    Returns
+    Yields
     -------
-    files_to_return: list
-        List of absolute file paths for all files in all directories under root_path.
+    tuple
+        (absolute file path, path relative to root_path, size in bytes) for each file
+        directly under root_path.
     """
-    try:
-        files = [
-            name
-            for name in os.listdir(root_path)
-            if not os.path.isdir(os.path.join(root_path, name))
-        ]
-
-        return list(
-            clean_file_list(root_path=root_path, files=files, extensions=extensions)
-        )
+    extensions = normalize_extensions(extensions)
+    suffixes, suffix_length = _suffix_lookup(extensions)
+
+    files, _ = _scan_directory(
+        directory=_normalize_directory(root_path),
+        relative_directory="",
+        extensions=extensions,
+        suffixes=suffixes,
+        suffix_length=suffix_length,
+    )
 
-    except Exception as e:
-        raise e
+    yield from files
 
 
-def get_filenames_recursive(root_path: str, extensions: tuple = None) -> list:
+def get_filenames_recursive(
+    root_path: str,
+    extensions: tuple = None,
+    max_workers: int = SCAN_WORKERS,
+    skip_dirs: Iterable[str] = None,
+    skip_hidden_dirs: bool = False,
+) -> Iterator[Tuple[str, str, int]]:
     """
-    Gathers up all filenames under a root directory recursively.
+    Gathers up all filenames under a root directory recursively. Directories are
+    scanned concurrently, so on network filesystems the per-directory round-trips
+    overlap instead of adding up. Files are yielded in no particular order.
 
     Parameters
     ----------
@@ -232,30 +828,67 @@ def get_filenames_recursive(root_path: str, extensions: tuple = None) -> list:
         Absolute root file path that contains files you wish to retrieve.
 
     extensions: tuple (Optional)
-        Valid file extensions to be returned.
+        Valid file extensions to be returned. Matching is case-insensitive.
 
-    Returns
+    max_workers: int (Optional)
+        Maximum number of directories to scan at the same time. Defaults to
+        SCAN_WORKERS - the scan_workers environment variable, or 16.
+
+    skip_dirs: Iterable[str] (Optional)
+        Names of directories not to descend into, e.g. ("node_modules", "__pycache__").
+
+    skip_hidden_dirs: bool (Optional, default = False)
+        Whether to skip directories whose names start with ".".
+
+    Yields
     -------
-    files_to_return: list
-        List of absolute file paths for all files in all directories under root_path.
+    tuple
+        (absolute file path, path relative to root_path, size in bytes) for each file in
+        all directories under root_path. Relative paths always use "/" as the separator.
     """
-    try:
-        files_to_return = []
-
-        for root, dirs, files in os.walk(top=root_path):
-            files_to_return += clean_file_list(
-                root_path=root, files=files, extensions=extensions
+    extensions = normalize_extensions(extensions)
+    # Worked out once for the whole walk rather than once per directory.
+    suffixes, suffix_length = _suffix_lookup(extensions)
+    skip_dirs = frozenset(skip_dirs or ())
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def _submit(directory, relative_directory):
+            return executor.submit(
+                _scan_directory,
+                directory=directory,
+                relative_directory=relative_directory,
+                extensions=extensions,
+                suffixes=suffixes,
+                suffix_length=suffix_length,
+                skip_dirs=skip_dirs,
+                skip_hidden_dirs=skip_hidden_dirs,
             )
 
-        return files_to_return
+        # Each directory is tracked by its "/"-terminated absolute and relative paths, so
+        # every path below the root is built by concatenation - separators are only
+        # normalized once, for root_path. The walk is done once no scans are in flight.
+        pending = {_submit(_normalize_directory(root_path), "")}
 
-    except Exception as e:
-        raise e
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                files, subdirectories = future.result()
+                pending.update(
+                    _submit(*subdirectory) for subdirectory in subdirectories
+                )
+
+                yield from files
 
 
 def get_filenames(
-    root_path: str, recursive: bool = False, extensions: tuple = None
-) -> list:
+    root_path: str,
+    recursive: bool = False,
+    extensions: tuple = None,
+    skip_dirs: Iterable[str] = None,
+    skip_hidden_dirs: bool = False,
+) -> Iterator[Tuple[str, str, int]]:
     """
     Gets the filenames and absolute paths for those files from
     the root_path specified.
@@ -269,25 +902,32 @@ def get_filenames(
         Whether you want to recursively retrieve files in subdirectories or not.
 
     extensions: tuple (Optional)
-        Valid file extensions to be returned.
+        Valid file extensions to be returned. Matching is case-insensitive.
+
+    skip_dirs: Iterable[str] (Optional)
+        Names of directories not to descend into when recursive is True.
+
+    skip_hidden_dirs: bool (Optional, default = False)
+        Whether to skip directories whose names start with "." when recursive is True.
 
     Returns
     -------
-    files: list
-        Files from the root_path with the desired extensions.
+    files: Iterator[Tuple[str, str, int]]
+        Lazy iterator over (path, path relative to root_path, size in bytes) for the files
+        from the root_path with the desired extensions.
     """
 
-    try:
-
-        if recursive:
-            files = get_filenames_recursive(root_path=root_path, extensions=extensions)
-        else:
-            files = get_filenames_flat(root_path=root_path, extensions=extensions)
-
-        return list(files)
+    if recursive:
+        files = get_filenames_recursive(
+            root_path=root_path,
+            extensions=extensions,
+            skip_dirs=skip_dirs,
+            skip_hidden_dirs=skip_hidden_dirs,
+        )
+    else:
+        files = get_filenames_flat(root_path=root_path, extensions=extensions)
 
-    except Exception as e:
-        raise e
+    return files
 
 
 def check_path_is_directory(root_path):
@@ -313,36 +953,179 @@ def check_path_is_directory(root_path):
         raise FileNotFoundError(f"{root_path} does not exist as a file or directory!")
 
 
+def get_object_key(file: str, relative_path: str, key_prefix: str = None) -> str:
+    """
+    Computes the S3 object key a local file will be uploaded to.
+
+    Parameters
+    ----------
+    file: str
+        Path to the local file.
+
+    relative_path: str
+        Path of the file relative to the upload root, using "/" as the separator.
+        In the case of single-file uploads, this is just the file name.
+
+    key_prefix: str (Optional)
+        The key prefix of the files you wish to upload, as returned by
+        normalize_key_prefix. If this is not passed in, the file's own path is used
+        as the key.
+
+    Returns
+    -------
+    str
+        The object key for the file.
+    """
+    if key_prefix:
+        return key_prefix + relative_path
+    else:
+        return file
+
+
+def normalize_key_prefix(key_prefix: str = None) -> str:
+    """
+    Normalizes a key prefix so it ends with exactly one "/".
+
+    Parameters
+    ----------
+    key_prefix: str (Optional)
+        The key prefix of the files you wish to upload, e.g. "videos" or "videos/".
+
+    Returns
+    -------
+    str
+        The key prefix ending in "/", e.g. "videos/", or None if no prefix was given.
+    """
+    if not key_prefix:
+        return None
+
+    return key_prefix.rstrip("/") + "/"
+
+
+def _upload_one(
+    client: boto3.client,
+    file: str,
+    relative_path: str,
+    file_size: int,
+    bucket_name: str,
+    key_prefix: str,
+    replace_if_exists: bool,
+    existing_keys: set,
+    max_concurrency: int,
+) -> None:
+    """
+    Uploads a single file for upload_files / upload_files_async, unless it already exists
+    and should not be replaced. Blocks until the upload is done.
+
+    Parameters
+    ----------
+    client: boto3.client
+        Boto3 S3 client.
+
+    file: str
+        Path of the file to upload.
+
+    relative_path: str
+        Path of the file relative to the upload root.
+
+    file_size: int
+        Size of the file in bytes.
+
+    bucket_name: str
+        The name of the destination S3 Bucket.
+
+    key_prefix: str
+        Normalized key prefix (see normalize_key_prefix), or None.
+
+    replace_if_exists: bool
+        Whether to replace the file if it already exists in S3.
+
+    existing_keys: set
+        Keys already under key_prefix, or None to check the file with a HEAD request.
+
+    max_concurrency: int
+        Number of parts of a multipart upload to send at the same time, or None.
+
+    Returns
+    -------
+    None
+    """
+    key = get_object_key(file=file, relative_path=relative_path, key_prefix=key_prefix)
+
+    # Existing objects get overwritten anyway, so there is nothing to check.
+    if replace_if_exists:
+        file_exists = False
+    elif existing_keys is not None:
+        file_exists = key in existing_keys
+    else:
+        file_exists = check_object_exists(
+            s3_client=client, bucket_name=bucket_name, object_key=key
+        )
+
+    if not file_exists:
+        print(f"Destination: s3://{bucket_name}/{key}")
+        upload_file_to_s3(
+            s3_client=client,
+            path_to_file=file,
+            bucket_name=bucket_name,
+            object_key=key,
+            file_size=file_size,
+            max_concurrency=max_concurrency,
+        )
+    else:
+        print(f"{file} already exists in S3 and will not be replaced.")
+
+
+def _finished_message(completed: int, total: int, submitted: int) -> str:
+    """
+    Formats the progress line printed after each file finishes.
+
+    Parameters
+    ----------
+    completed: int
+        Number of files finished so far.
+
+    total: int
+        Total number of files, or None if it isn't known up front.
+
+    submitted: int
+        Number of files submitted so far, reported when total is None.
+
+    Returns
+    -------
+    str
+        The progress line.
+    """
+    if total is None:
+        return f"\nFinished {completed} of {submitted} submitted files"
+    return f"\nFinished {completed} of {total} files"
+
+
 def upload_files(
     client: boto3.client,
-    files: list,
-    root_path: str,
+    files: Iterable[Tuple[str, str, int]],
     replace_if_exists: bool,
-    root_path_is_directory: bool,
     bucket_name: str,
     key_prefix: str = None,
+    max_workers: int = MAX_WORKERS,
+    max_concurrency: int = None,
 ):
     """
-    Uploads a list of files to S3.
+    Uploads files to S3. Files are uploaded concurrently, sharing the same client.
 
     Parameters
     ----------
     client: boto3.client
         Boto3 S3 client.
 
-    files: list
-        List of filenames to upload
-
-    root_path: str
-        The root path where the files are located. In the case of single-file uploads,
-        this is just the location of the file.
+    files: Iterable[Tuple[str, str, int]]
+        (filename, path relative to the upload root, size in bytes) to upload, as produced
+        by get_filenames. This may be a lazy iterator - uploads are scheduled as filenames
+        are produced, so uploading starts before a directory scan finishes.
 
     replace_if_exists: bool
         Whether to replace files that already exist in S3.
 
-    root_path_is_directory: bool
-        Whether the root_path passed in is a directory or a single file.
-
     bucket_name: str
         The name of the destination S3 Bucket.
 
@@ -353,40 +1136,184 @@ def upload_files(
         E.g., if this is not passed in, your files will be located as C:/Users/path/to/files/
         in the S3 bucket.
 
+    max_workers: int (Optional)
+        Maximum number of files to upload at the same time. Defaults to MAX_WORKERS -
+        the max_workers environment variable, or 16.
+
+    max_concurrency: int (Optional)
+        Number of parts of each multipart upload to send at the same time.
+        Defaults to CONFIG.max_concurrency.
+
     Returns
     -------
     None
     """
-    try:
-        for file in files:
-            print(f"Uploading file {files.index(file) + 1} of {len(files)}")
 
-            if key_prefix and root_path_is_directory:
-                key = file.replace(root_path, key_prefix)
-            elif key_prefix and not root_path_is_directory:
-                key = f"{key_prefix}{file.split('/')[-1]}"
-            else:
-                key = file
+    # The total is only known up front when a materialized collection is passed in -
+    # lazy iterators are never consumed just to count them.
+    total = len(files) if isinstance(files, Sized) else None
+
+    def _process_one(idx, file, relative_path, file_size):
+        if total is not None:
+            print(f"Uploading file {idx} of {total}: {file}")
+        else:
+            print(f"Uploading file {idx}: {file}")
+
+        _upload_one(
+            client=client,
+            file=file,
+            relative_path=relative_path,
+            file_size=file_size,
+            bucket_name=bucket_name,
+            key_prefix=key_prefix,
+            replace_if_exists=replace_if_exists,
+            existing_keys=existing_keys,
+            max_concurrency=max_concurrency,
+        )
+
+    key_prefix = normalize_key_prefix(key_prefix)
 
-            file_exists = check_object_exists(
-                s3_client=client, bucket_name=bucket_name, object_key=key
+    # Every key lands under key_prefix, so a single paginated listing (1000 keys per
+    # request) replaces one existence-check request per file.
+    existing_keys = None
+    if key_prefix and not replace_if_exists:
+        existing_keys = _list_existing_keys(
+            s3_client=client, bucket_name=bucket_name, prefix=key_prefix, files=files
+        )
+
+    idx = completed = 0
+    pending = set()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for idx, (file, relative_path, file_size) in enumerate(files, 1):
+            pending.add(
+                executor.submit(_process_one, idx, file, relative_path, file_size)
             )
 
-            if (not file_exists) or (file_exists and replace_if_exists):
-                print(f"Destination: s3://{bucket_name}/{key}")
-                upload_file_to_s3(
-                    s3_client=client,
-                    path_to_file=file,
-                    bucket_name=bucket_name,
-                    object_key=key,
-                )
-            else:
-                print("File already exists in S3 and will not be replaced.")
+            # Keep the queue bounded so a large directory scan never holds more
+            # than a couple of batches of filenames in memory at once.
+            if len(pending) >= max_workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+                    completed += 1
+                    print(_finished_message(completed, total, idx))
+
+        for future in as_completed(pending):
+            future.result()
+            completed += 1
+            print(_finished_message(completed, total, idx))
+
+
+async def upload_files_async(
+    client: boto3.client,
+    files: Iterable[Tuple[str, str, int]],
+    replace_if_exists: bool,
+    bucket_name: str,
+    key_prefix: str = None,
+    max_workers: int = MAX_WORKERS,
+    max_concurrency: int = None,
+):
+    """
+    Uploads files to S3 from an asyncio event loop. Same behaviour as upload_files:
+    max_workers tasks take filenames from a bounded queue as they are produced, and
+    run each upload on a dedicated pool of max_workers threads.
+
+    Parameters
+    ----------
+    client: boto3.client
+        Boto3 S3 client.
+
+    files: Iterable[Tuple[str, str, int]]
+        (filename, path relative to the upload root, size in bytes) to upload, as produced
+        by get_filenames. This may be a lazy iterator, as with upload_files.
 
-            print('\n')
+    replace_if_exists: bool
+        Whether to replace files that already exist in S3.
+
+    bucket_name: str
+        The name of the destination S3 Bucket.
+
+    key_prefix: str (Optional)
+        The key prefix of the files you wish to upload. If you do not specify this,
+        the files will be uploaded using the absolute path from your computer.
+
+    max_workers: int (Optional)
+        Maximum number of files to upload at the same time. Defaults to MAX_WORKERS -
+        the max_workers environment variable, or 16.
+
+    max_concurrency: int (Optional)
+        Number of parts of each multipart upload to send at the same time.
+        Defaults to CONFIG.max_concurrency.
 
-    except Exception as e:
-        raise e
+    Returns
+    -------
+    None
+    """
+    # Same as upload_files: only count files that are already materialized.
+    total = len(files) if isinstance(files, Sized) else None
+    key_prefix = normalize_key_prefix(key_prefix)
+    existing_keys = None
+
+    if key_prefix and not replace_if_exists:
+        existing_keys = await asyncio.to_thread(
+            _list_existing_keys,
+            s3_client=client,
+            bucket_name=bucket_name,
+            prefix=key_prefix,
+            files=files,
+        )
+
+    loop = asyncio.get_running_loop()
+    # Bounded like upload_files, so a large directory scan is consumed as uploads
+    # finish instead of being loaded into memory up front.
+    queue = asyncio.Queue(maxsize=max_workers * 2)
+    submitted = completed = 0
+
+    async def _produce():
+        nonlocal submitted
+        iterator = iter(files)
+        # The next filename is fetched off the event loop - for a lazy directory scan,
+        # fetching it can mean waiting on the filesystem.
+        while (item := await asyncio.to_thread(next, iterator, None)) is not None:
+            submitted += 1
+            await queue.put((submitted, *item))
+        for _ in range(max_workers):
+            await queue.put(None)
+
+    async def _consume(executor):
+        nonlocal completed
+        while (item := await queue.get()) is not None:
+            idx, file, relative_path, file_size = item
+            if total is not None:
+                print(f"Uploading file {idx} of {total}: {file}")
+            else:
+                print(f"Uploading file {idx}: {file}")
+
+            await loop.run_in_executor(
+                executor,
+                functools.partial(
+                    _upload_one,
+                    client=client,
+                    file=file,
+                    relative_path=relative_path,
+                    file_size=file_size,
+                    bucket_name=bucket_name,
+                    key_prefix=key_prefix,
+                    replace_if_exists=replace_if_exists,
+                    existing_keys=existing_keys,
+                    max_concurrency=max_concurrency,
+                ),
+            )
+            completed += 1
+            print(_finished_message(completed, total, submitted))
+
+    # Uploads get their own pool of max_workers threads rather than asyncio's default
+    # executor, which is capped at min(32, cpu_count + 4) threads.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        await asyncio.gather(
+            _produce(), *(_consume(executor) for _ in range(max_workers))
+        )
 
 
 def boilerplate_warning():